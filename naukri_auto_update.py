@@ -5,24 +5,22 @@ Author: Akhilesh Kumar Singh
 Purpose: Daily profile update to stay on top of recruiter searches
 """
 
+import functools
 import json
 import logging
 import os
 import random
-import smtplib
+import socket
 import time
 from datetime import datetime
-from email.mime.text import MIMEText
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
 
 # Setup logging
 LOG_FILE = os.path.expanduser('~/naukri_updates.log')
@@ -32,12 +30,73 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 CONFIG_PATH = os.path.expanduser('~/naukri_auto_update/config.json')
+PROFILE_URL = 'https://www.naukri.com/mnjuser/profile'
+
+# Element selectors, built once at import and reused on every lookup.
+# Entries are tried in order, so scoped selectors always win over broader
+# fallbacks. Only selectors that target the same element are joined into an
+# XPath union (one find_elements round-trip), because a union returns its
+# matches in document order rather than in priority order.
+RESUME_HEADLINE_EDIT_SELECTORS = (
+    (
+        By.XPATH,
+        "id('lazyResumeHead')//span[contains(@class, 'edit')]"
+        " | id('lazyResumeHead')//button[contains(@class, 'edit')]",
+    ),
+)
+RESUME_HEADLINE_TEXTAREA_SELECTORS = (
+    (By.XPATH, "//textarea[contains(@id, 'resumeHeadlineTxt') or contains(@id, 'resumeHeadline') or contains(@name, 'resumeHeadline')]"),
+    (By.XPATH, "//textarea[contains(@placeholder, 'headline') or contains(@placeholder, 'Headline')]"),
+)
+RESUME_HEADLINE_SAVE_SELECTORS = (
+    (
+        By.XPATH,
+        "//div[contains(@class, 'resumeHeadlineEdit') and contains(@class, 'flipOpen')]//button[contains(., 'Save') or contains(., 'SAVE')]"
+        " | //form[@name='resumeHeadlineForm']//button[contains(., 'Save') or contains(., 'SAVE')]",
+    ),
+    (By.XPATH, "//button[contains(., 'Save') or contains(., 'SAVE')]"),
+)
+PROFILE_SUMMARY_EDIT_SELECTORS = (
+    (
+        By.XPATH,
+        "id('lazyProfileSummary')//span[contains(@class, 'edit')]"
+        " | id('lazyProfileSummary')//button[contains(@class, 'edit')]",
+    ),
+)
+PROFILE_SUMMARY_TEXTAREA_SELECTORS = (
+    (By.XPATH, "//textarea[contains(@id, 'profileSummaryTxt') or contains(@id, 'profileSummary') or contains(@name, 'profileSummary')]"),
+    (By.XPATH, "//textarea[contains(@placeholder, 'Summary') or contains(@placeholder, 'summary')]"),
+)
+PROFILE_SUMMARY_SAVE_SELECTORS = (
+    (
+        By.XPATH,
+        "//div[contains(@class, 'keySkillsEdit') and contains(@class, 'flipOpen')]//button[@id='saveKeySkills']"
+        " | //form[@name='keySkillsForm']//button[@id='saveKeySkills']",
+    ),
+    (By.XPATH, "//div[contains(@class, 'keySkillsEdit') and contains(@class, 'flipOpen')]//button[contains(., 'Save') or contains(., 'SAVE')]"),
+)
+KEY_SKILLS_EDIT_SELECTORS = (
+    (
+        By.XPATH,
+        "id('lazyKeySkills')//span[contains(@class, 'edit')]"
+        " | id('lazyKeySkills')//button[contains(@class, 'edit')]",
+    ),
+)
+KEY_SKILLS_LAYER_SELECTORS = (
+    (By.XPATH, "//div[contains(@class, 'keySkillsEdit') and contains(@class, 'flipOpen')]"),
+)
+KEY_SKILLS_SAVE_SELECTORS = (
+    (By.XPATH, "//div[contains(@class, 'keySkillsEdit') and contains(@class, 'flipOpen')]//button[contains(., 'Save') or contains(., 'SAVE')]"),
+)
 
 class NaukriAutoUpdater:
-    def __init__(self, email, password):
+    def __init__(self, email, password, debug_dumps=True):
         self.email = email
         self.password = password
         self.driver = None
+        self.keep_browser = False
+        self._debug_dumps = debug_dumps
+        self._dumped_labels = set()
 
     def _safe_click(self, element):
         self.driver.execute_script(
@@ -72,25 +131,48 @@ class NaukriAutoUpdater:
             value,
         )
 
+    def _wait(self, timeout=10, ignored_exceptions=None):
+        # Poll faster than Selenium's 0.5s default; these are local DOM checks
+        return WebDriverWait(
+            self.driver,
+            timeout,
+            poll_frequency=0.1,
+            ignored_exceptions=ignored_exceptions,
+        )
+
+    def _first_clickable_index(self, elements):
+        # One script call checks every candidate instead of two
+        # is_displayed/is_enabled round-trips per element.
+        if not elements:
+            return -1
+        return self.driver.execute_script(
+            "for (var i = 0; i < arguments.length; i++) {"
+            "  var e = arguments[i];"
+            "  var style = window.getComputedStyle(e);"
+            "  if (e.getClientRects().length && style.visibility !== 'hidden'"
+            "      && !e.disabled) { return i; }"
+            "}"
+            "return -1;",
+            *elements,
+        )
+
     def _find_clickable(self, selectors, timeout=12):
         if not selectors:
             raise ValueError("No selectors provided")
-        end_time = time.time() + timeout
-        last_exc = None
-        while time.time() < end_time:
+
+        def first_clickable(driver):
             for by, selector in selectors:
-                try:
-                    elements = self.driver.find_elements(by, selector)
-                    for element in elements:
-                        if element.is_displayed() and element.is_enabled():
-                            logging.info("Found clickable element: %s %s", by, selector)
-                            return element
-                except Exception as e:
-                    last_exc = e
-            time.sleep(0.2)
-        if last_exc:
-            raise last_exc
-        raise TimeoutException(f"No clickable element found for selectors: {selectors}")
+                elements = driver.find_elements(by, selector)
+                index = self._first_clickable_index(elements)
+                if index >= 0:
+                    logging.info("Found clickable element: %s %s", by, selector)
+                    return elements[index]
+            return False
+
+        return self._wait(
+            timeout,
+            ignored_exceptions=(StaleElementReferenceException,),
+        ).until(first_clickable, f"No clickable element found for selectors: {selectors}")
 
     def _find_visible(self, selectors, timeout=12):
         if not selectors:
@@ -98,16 +180,37 @@ class NaukriAutoUpdater:
         last_exc = None
         for by, selector in selectors:
             try:
-                element = WebDriverWait(self.driver, timeout).until(
-                    EC.visibility_of_element_located((by, selector))
-                )
+                element = self._wait(timeout).until(
+                    EC.visibility_of_any_elements_located((by, selector))
+                )[0]
                 logging.info("Found visible element: %s %s", by, selector)
                 return element
             except Exception as e:
                 last_exc = e
         raise last_exc
 
+    def _wait_for_profile_page(self, timeout=10):
+        try:
+            self._wait(timeout).until(EC.any_of(
+                EC.presence_of_element_located((By.ID, "lazyResumeHead")),
+                EC.presence_of_element_located((By.ID, "usernameField")),
+            ))
+        except TimeoutException:
+            logging.warning("Profile page did not settle within %ss", timeout)
+
+    def _wait_for_save(self, save_button, timeout=10):
+        # Raises TimeoutException so the caller reports the save as failed
+        self._wait(timeout).until(
+            EC.invisibility_of_element(save_button),
+            f"Save button still visible after {timeout}s",
+        )
+
     def _dump_debug(self, label):
+        # Screenshot + page_source are slow; allow turning them off and
+        # never write the same label twice in one run.
+        if not self._debug_dumps or label in self._dumped_labels:
+            return
+        self._dumped_labels.add(label)
         try:
             ts = datetime.now().strftime('%Y%m%d_%H%M%S')
             debug_dir = os.path.expanduser('~/naukri_auto_update/debug')
@@ -120,15 +223,32 @@ class NaukriAutoUpdater:
         except Exception as e:
             logging.error("Failed to save debug files: %s", repr(e))
 
-    def _is_login_page(self):
+    def _page_state(self):
+        # Gather url, title, profile/login form and captcha markers in one round-trip
+        # instead of pulling the whole page_source back through the driver.
+        return self.driver.execute_script(
+            "return {"
+            "  url: location.href,"
+            "  title: document.title,"
+            "  resumePresent: !!document.getElementById('lazyResumeHead'),"
+            "  loginPresent: !!document.getElementById('usernameField'),"
+            "  hasCaptcha: /captcha/i.test(document.documentElement.innerHTML)"
+            "};"
+        ) or {}
+
+    def _is_login_page(self, state=None):
         try:
-            if "nlogin" in (self.driver.current_url or ""):
-                return True
-            return bool(self.driver.find_elements(By.ID, "usernameField"))
+            if state is None:
+                state = self._page_state()
+            return "nlogin" in (state.get('url') or "") or bool(state.get('loginPresent'))
         except Exception:
             return False
 
     def _setup_firefox(self, config):
+        # Imported here so Chrome-only runs skip loading the Firefox modules
+        from selenium.webdriver.firefox.options import Options as FirefoxOptions
+        from selenium.webdriver.firefox.service import Service as FirefoxService
+
         firefox_options = FirefoxOptions()
         # Run in headless mode (no browser window)
         # firefox_options.add_argument('-headless')
@@ -146,20 +266,59 @@ class NaukriAutoUpdater:
             self.driver = webdriver.Firefox(service=service, options=firefox_options)
         else:
             self.driver = webdriver.Firefox(options=firefox_options)
+        self.keep_browser = False
         logging.info("Firefox driver initialized")
 
+    def _debug_port_open(self, debug_port):
+        try:
+            socket.create_connection(('127.0.0.1', debug_port), timeout=1).close()
+            return True
+        except OSError:
+            return False
+
+    def _attach_chrome(self, driver_path, debug_port):
+        """Attach to a Chrome left running by a previous run"""
+        chrome_options = Options()
+        chrome_options.add_experimental_option("debuggerAddress", f"127.0.0.1:{debug_port}")
+        try:
+            if driver_path:
+                service = Service(driver_path)
+                self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            else:
+                self.driver = webdriver.Chrome(options=chrome_options)
+        except Exception as e:
+            logging.warning("Attach to Chrome on port %s failed: %s", debug_port, repr(e))
+            return False
+        self.keep_browser = True
+        logging.info("Attached to running Chrome on debug port %s", debug_port)
+        return True
+
     def _setup_chrome(self, config):
+        driver_path = config.get('chromedriver_path')
+        debug_port = config.get('chrome_debug_port')
+        profile_dir = config.get('chrome_profile_dir')
+        if debug_port and self._debug_port_open(debug_port):
+            if self._attach_chrome(driver_path, debug_port):
+                return
+            # Whatever holds the port (and likely the profile dir) would make a
+            # second persistent launch fail, so run a one-off browser instead.
+            logging.error(
+                "Debug port %s is in use but attach failed; launching a "
+                "temporary Chrome without debug port or profile dir",
+                debug_port,
+            )
+            debug_port = None
+            profile_dir = None
+        elif debug_port:
+            logging.info("No Chrome listening on debug port %s; launching new", debug_port)
+
         chrome_options = Options()
         # Run in headless mode (no browser window)
-        # chrome_options.add_argument('--headless')
+        # chrome_options.add_argument('--headless=new')
         chrome_options.add_argument('--window-size=1280,800')
         chrome_options.add_argument('--disable-extensions')
         chrome_options.add_argument('--disable-notifications')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--disable-software-rasterizer')
-        driver_path = config.get('chromedriver_path')
         chrome_binary = config.get('chrome_binary')
-        profile_dir = config.get('chrome_profile_dir')
         logging.info(
             "Chrome launch config binary=%s driver=%s profile=%s",
             chrome_binary,
@@ -173,11 +332,16 @@ class NaukriAutoUpdater:
             chrome_options.add_argument(f'--user-data-dir={profile_dir}')
             chrome_options.add_argument('--no-first-run')
             chrome_options.add_argument('--no-default-browser-check')
+        if debug_port:
+            # Leave the browser running after this run so the next one can attach
+            chrome_options.add_argument(f'--remote-debugging-port={debug_port}')
+            chrome_options.add_experimental_option('detach', True)
         if driver_path:
             service = Service(driver_path)
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
         else:
             self.driver = webdriver.Chrome(options=chrome_options)
+        self.keep_browser = bool(debug_port)
         logging.info("Chrome driver initialized")
 
     def setup_driver(self, browser_override=None, allow_fallback=True):
@@ -205,10 +369,9 @@ class NaukriAutoUpdater:
         """Login to Naukri"""
         try:
             self.driver.get('https://www.naukri.com/nlogin/login')
-            time.sleep(2)
             
             # Enter email
-            email_field = WebDriverWait(self.driver, 10).until(
+            email_field = self._wait(10).until(
                 EC.presence_of_element_located((By.ID, "usernameField"))
             )
             email_field.send_keys(self.email)
@@ -222,7 +385,9 @@ class NaukriAutoUpdater:
             login_button.click()
             
             # Wait for login to complete
-            time.sleep(5)
+            self._wait(15).until(
+                lambda d: "nlogin" not in (d.current_url or "")
+            )
             logging.info("Login successful")
             return True
             
@@ -230,18 +395,35 @@ class NaukriAutoUpdater:
             logging.error(f"Login failed: {str(e)}")
             return False
     
+    def ensure_logged_in(self):
+        """Reuse a saved session if the profile page opens, else log in"""
+        try:
+            self.driver.get(PROFILE_URL)
+            self._wait_for_profile_page()
+            # Skip login only on positive proof of the profile page; a slow
+            # redirect, interstitial or failed probe all fall through to login
+            state = self._page_state()
+            if state.get('resumePresent') and not self._is_login_page(state):
+                logging.info("Existing session is valid; skipping login")
+                return True
+        except Exception as e:
+            logging.warning("Session check failed: %s", repr(e))
+        return self.login()
+
     def update_profile(self, headline_variants=None, summary_variants=None):
         """Make minor updates to profile"""
         try:
-            # Navigate to profile page
-            self.driver.get('https://www.naukri.com/mnjuser/profile')
-            time.sleep(3)
-            logging.info("Profile page url=%s title=%s", self.driver.current_url, self.driver.title)
-            if self._is_login_page():
+            # Navigate to profile page unless the session check already did
+            if PROFILE_URL not in (self.driver.current_url or ""):
+                self.driver.get(PROFILE_URL)
+                self._wait_for_profile_page()
+            state = self._page_state()
+            logging.info("Profile page url=%s title=%s", state.get('url'), state.get('title'))
+            if self._is_login_page(state):
                 logging.error("Login required; profile page not accessible")
                 self._dump_debug("login_required")
                 return False
-            if "captcha" in (self.driver.page_source or "").lower():
+            if state.get('hasCaptcha'):
                 logging.error("Captcha detected; manual intervention required")
                 self._dump_debug("captcha")
                 return False
@@ -273,19 +455,11 @@ class NaukriAutoUpdater:
         """Update resume headline with minor change"""
         try:
             # Click edit button for resume headline
-            edit_button = self._find_clickable([
-                (By.XPATH, "//div[@id='lazyResumeHead']//span[contains(@class, 'edit')]"),
-                (By.XPATH, "//div[contains(., 'Resume Headline')]//span[contains(@class, 'edit')]"),
-                (By.XPATH, "//button[contains(@class, 'edit') and ancestor::*[contains(., 'Resume Headline')]]"),
-            ])
+            edit_button = self._find_clickable(RESUME_HEADLINE_EDIT_SELECTORS)
             self._safe_click(edit_button)
-            time.sleep(1)
             
             # Find the headline text area
-            headline_textarea = self._find_visible([
-                (By.XPATH, "//textarea[contains(@id, 'resumeHeadlineTxt') or contains(@id, 'resumeHeadline') or contains(@name, 'resumeHeadline')]"),
-                (By.XPATH, "//textarea[contains(@placeholder, 'headline') or contains(@placeholder, 'Headline')]"),
-            ])
+            headline_textarea = self._find_visible(RESUME_HEADLINE_TEXTAREA_SELECTORS)
             self._safe_click(headline_textarea)
             
             # Get current text
@@ -299,18 +473,13 @@ class NaukriAutoUpdater:
                 else:
                     new_text = current_text + ' '
             
-            # Clear and enter new text
+            # Replace the text in one script call (no per-key round-trips)
             self._set_text_value(headline_textarea, new_text)
-            time.sleep(1)
             
             # Click save button
-            save_button = self._find_clickable([
-                (By.XPATH, "//div[contains(@class, 'resumeHeadlineEdit') and contains(@class, 'flipOpen')]//button[contains(., 'Save') or contains(., 'SAVE')]"),
-                (By.XPATH, "//form[@name='resumeHeadlineForm']//button[contains(., 'Save') or contains(., 'SAVE')]"),
-                (By.XPATH, "//button[contains(., 'Save') or contains(., 'SAVE')]"),
-            ])
+            save_button = self._find_clickable(RESUME_HEADLINE_SAVE_SELECTORS)
             self._safe_click(save_button)
-            time.sleep(2)
+            self._wait_for_save(save_button)
             
             logging.info("Resume headline updated")
             return True
@@ -327,18 +496,10 @@ class NaukriAutoUpdater:
                 logging.info("No profile summary variants configured; skipping")
                 return False
 
-            edit_button = self._find_clickable([
-                (By.XPATH, "//div[@id='lazyProfileSummary']//span[contains(@class, 'edit')]"),
-                (By.XPATH, "//div[contains(., 'Profile Summary')]//span[contains(@class, 'edit')]"),
-                (By.XPATH, "//button[contains(@class, 'edit') and ancestor::*[contains(., 'Profile Summary')]]"),
-            ])
+            edit_button = self._find_clickable(PROFILE_SUMMARY_EDIT_SELECTORS)
             self._safe_click(edit_button)
-            time.sleep(1)
 
-            summary_textarea = self._find_visible([
-                (By.XPATH, "//textarea[contains(@id, 'profileSummaryTxt') or contains(@id, 'profileSummary') or contains(@name, 'profileSummary')]"),
-                (By.XPATH, "//textarea[contains(@placeholder, 'Summary') or contains(@placeholder, 'summary')]"),
-            ])
+            summary_textarea = self._find_visible(PROFILE_SUMMARY_TEXTAREA_SELECTORS)
             self._safe_click(summary_textarea)
 
             current_text = summary_textarea.get_attribute('value')
@@ -348,15 +509,10 @@ class NaukriAutoUpdater:
                 return False
 
             self._set_text_value(summary_textarea, new_text)
-            time.sleep(1)
 
-            save_button = self._find_clickable([
-                (By.XPATH, "//div[contains(@class, 'keySkillsEdit') and contains(@class, 'flipOpen')]//button[@id='saveKeySkills']"),
-                (By.XPATH, "//form[@name='keySkillsForm']//button[@id='saveKeySkills']"),
-                (By.XPATH, "//div[contains(@class, 'keySkillsEdit') and contains(@class, 'flipOpen')]//button[contains(., 'Save') or contains(., 'SAVE')]"),
-            ])
+            save_button = self._find_clickable(PROFILE_SUMMARY_SAVE_SELECTORS)
             self._safe_click(save_button)
-            time.sleep(2)
+            self._wait_for_save(save_button)
 
             logging.info("Profile summary updated")
             return True
@@ -369,20 +525,14 @@ class NaukriAutoUpdater:
         """Alternative: Reorder key skills"""
         try:
             # Click edit button for key skills
-            edit_button = self._find_clickable([
-                (By.XPATH, "//div[@id='lazyKeySkills']//span[contains(@class, 'edit')]"),
-                (By.XPATH, "//div[contains(., 'Key skills') or contains(., 'Key Skills')]//span[contains(@class, 'edit')]"),
-                (By.XPATH, "//button[contains(@class, 'edit') and ancestor::*[contains(., 'Key skills') or contains(., 'Key Skills')]]"),
-            ])
+            edit_button = self._find_clickable(KEY_SKILLS_EDIT_SELECTORS)
             self._safe_click(edit_button)
-            time.sleep(2)
+            self._find_visible(KEY_SKILLS_LAYER_SELECTORS)
             
             # Just click save without changes (still updates timestamp)
-            save_button = self._find_clickable([
-                (By.XPATH, "//button[contains(., 'Save') or contains(., 'SAVE')]"),
-            ])
+            save_button = self._find_clickable(KEY_SKILLS_SAVE_SELECTORS)
             self._safe_click(save_button)
-            time.sleep(2)
+            self._wait_for_save(save_button)
             
             logging.info("Key skills section updated")
             return True
@@ -394,12 +544,19 @@ class NaukriAutoUpdater:
     
     def close(self):
         """Close the browser"""
-        if self.driver:
+        if not self.driver:
+            return
+        if self.keep_browser:
+            # Stop only chromedriver; the browser stays up for the next run
+            self.driver.service.stop()
+            logging.info("Driver stopped; browser left running for reuse")
+        else:
             self.driver.quit()
             logging.info("Browser closed")
 
+@functools.lru_cache(maxsize=1)
 def load_config():
-    """Load configuration from config.json"""
+    """Load configuration from config.json (read once per process)"""
     if os.path.exists(CONFIG_PATH):
         with open(CONFIG_PATH, 'r') as f:
             return json.load(f)
@@ -414,6 +571,10 @@ def send_alert(status, message, config=None):
         logging.warning("Alert credentials not configured; skipping email alert")
         return
 
+    # Imported here so runs without alerts never load the SMTP/email modules
+    import smtplib
+    from email.mime.text import MIMEText
+
     msg = MIMEText(f"Naukri Update {status}: {message}")
     msg['Subject'] = f'Naukri Auto-Update {status}'
     msg['From'] = alert_from
@@ -431,36 +592,43 @@ def main():
     if config:
         EMAIL = config.get('email')
         PASSWORD = config.get('password')
-        RANDOMIZE_MINUTES = config.get('randomize_minutes', 15)
         headline_variants = config.get('headline_variants', [])
         summary_variants = config.get('summary_variants', [])
     else:
         # Use environment variables
         EMAIL = os.getenv('NAUKRI_EMAIL')
         PASSWORD = os.getenv('NAUKRI_PASSWORD')
-        RANDOMIZE_MINUTES = 15
         headline_variants = []
         summary_variants = []
-    alert_config = config or {}
+    # General settings; an env-only run still gets defaults via .get()
+    config = config or {}
+    alert_config = config
     
     if not EMAIL or not PASSWORD:
         logging.error("Email or password not configured")
         print("❌ Error: Email or password not configured")
         return
     
-    # Add randomization to timing (±15 minutes by default)
-    random_delay = random.randint(0, RANDOMIZE_MINUTES * 60)
+    # Start-time randomization is left to the scheduler (see README) so the
+    # process is not kept resident while it waits.
     logging.info(
-        "Run triggered ts=%s pid=%s config=%s randomize_minutes=%s random_delay_seconds=%s",
+        "Run triggered ts=%s pid=%s config=%s",
         datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
         os.getpid(),
         CONFIG_PATH,
-        RANDOMIZE_MINUTES,
-        random_delay,
     )
-    time.sleep(random_delay)
+    if 'randomize_minutes' in config:
+        logging.warning(
+            "randomize_minutes is no longer applied by the script; add the "
+            "delay to your cron/launchd/systemd entry (see README 'Schedule Daily Updates')"
+        )
+        print("⚠️ randomize_minutes is ignored; move the random delay to your scheduler (see README)")
     
-    updater = NaukriAutoUpdater(EMAIL, PASSWORD)
+    updater = NaukriAutoUpdater(
+        EMAIL,
+        PASSWORD,
+        debug_dumps=config.get('debug_dumps', True),
+    )
     browser = (config.get('browser') or 'chrome').lower() if config else 'chrome'
     fallback_browser = (config.get('fallback_browser') or 'firefox').lower() if config else 'firefox'
     fallback_on_failure = config.get('fallback_on_failure', True) if config else True
@@ -471,7 +639,7 @@ def main():
         updated = False
         updater.setup_driver()
 
-        if updater.login():
+        if updater.ensure_logged_in():
             updated = updater.update_profile(headline_variants, summary_variants)
         else:
             logging.error("Login failed, update aborted")
@@ -485,7 +653,7 @@ def main():
             logging.warning("Chrome update failed; retrying with Firefox fallback")
             updater.close()
             updater.setup_driver(browser_override='firefox', allow_fallback=False)
-            if updater.login():
+            if updater.ensure_logged_in():
                 updated = updater.update_profile(headline_variants, summary_variants)
             else:
                 logging.error("Fallback login failed")